@@ -13,6 +13,7 @@ from scylla.core.database import db
 from scylla.tasks import validate_pending_task
 from scylla.core.config import settings
 from scylla.services.proxy_service import proxy_service
+from scylla.services.validator_service import validator_service
 
 # Configure loggin
 logging.basicConfig(
@@ -49,10 +50,25 @@ async def main():
         logger.error(f"✗ CLI execution failed: {e}", exc_info=True)
         raise
     finally:
-        # Clean up database connection
+        # Release the shared validator session and database connection
+        await validator_service.close()
         await db.close()
         logger.debug("✓ Database connection closed")
 
 
-if __name__ == "__main__":
+def run() -> None:
+    """Run the CLI on uvloop when enabled and installed, else the stdlib loop."""
+    if settings.use_uvloop:
+        try:
+            import uvloop
+        except ImportError:
+            logger.debug("uvloop not installed, using default event loop")
+        else:
+            uvloop.run(main())
+            return
+
     asyncio.run(main())
+
+
+if __name__ == "__main__":
+    run()
@@ -9,8 +9,9 @@ validation, rotation, and quality scoring.
 import logging
 
 # Third-party imports
+import orjson
 from sanic import Sanic, Request
-from sanic.response import json as json_response, HTTPResponse, empty
+from sanic.response import json as json_response, HTTPResponse, empty, raw
 from sanic.log import LOGGING_CONFIG_DEFAULTS
 
 # Local imports
@@ -31,15 +32,19 @@ log_config["formatters"]["access"]["format"] = settings.log_format
 log_config["formatters"]["access"]["datefmt"] = "%H:%M:%S"
 
 # Create Sanic application
-app = Sanic("scylla", log_config=log_config)
+app = Sanic("scylla", log_config=log_config, dumps=orjson.dumps)
 app.config["REAL_IP_HEADER"] = "X-Real-IP"
 app.config["PROXIES_COUNT"] = 1
 app.config["FORWARDED_SECRET"] = settings.app_secret
+app.config["USE_UVLOOP"] = settings.use_uvloop
 
 # Register API blueprint
 app.blueprint(api_bp)
 app.static("/favicon.ico", "static/favicon.png")
 
+# The version payload never changes, so encode it once at import
+VERSION_BODY = orjson.dumps({"version": VERSION})
+
 
 @app.get("/robot.txt", name="robot_file")
 async def robot_file(request: Request):
@@ -47,13 +52,13 @@ async def robot_file(request: Request):
 
 
 @app.get("/", name="index")
-async def robot_file(request: Request):
+async def index(request: Request):
     return empty()
 
 
 @app.get("/version", name="version")
 async def version(request: Request):
-    return json_response({"version": VERSION})
+    return raw(VERSION_BODY, content_type="application/json")
 
 
 @app.before_server_start
@@ -134,9 +139,15 @@ async def handle_exception(request: Request, exception: Exception) -> HTTPRespon
 
 
 if __name__ == "__main__":
+    # APP_WORKER=0 lets Sanic spawn one worker per CPU core
+    if settings.app_worker:
+        worker_options = {"workers": settings.app_worker}
+    else:
+        worker_options = {"fast": True}
+
     app.run(
         host=settings.app_host,
         port=settings.app_port,
         dev=settings.app_debug,
-        workers=settings.app_worker,
+        **worker_options,
     )
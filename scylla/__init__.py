@@ -4,7 +4,21 @@ from sanic.logging.color import Colors as c
 
 __version__ = "1.0.0"
 
-CREATE_PROXY_TABLE = """
+# Pool-wide aggregates, shared by the proxy_stats view and the live fallback
+PROXY_STATS_COLUMNS = """
+    COUNT(*) AS total,
+    COUNT(*) FILTER (WHERE status = 1) AS active,
+    COUNT(*) FILTER (WHERE status = 2) AS inactive,
+    COUNT(*) FILTER (WHERE status = 0) AS checking,
+    COUNT(DISTINCT protocol) AS protocols,
+    COUNT(DISTINCT country) AS countries,
+    AVG(speed) FILTER (WHERE speed IS NOT NULL) AS avg_speed,
+    COUNT(*) FILTER (WHERE anonymity = 'transparent') AS transparent,
+    COUNT(*) FILTER (WHERE anonymity = 'anonymous') AS anonymous,
+    COUNT(*) FILTER (WHERE anonymity = 'elite') AS elite
+"""
+
+CREATE_PROXY_TABLE = f"""
     CREATE TABLE IF NOT EXISTS proxies (
         id SERIAL PRIMARY KEY,
         ip VARCHAR(45) NOT NULL,
@@ -16,18 +30,44 @@ CREATE_PROXY_TABLE = """
         speed FLOAT,
         success_count INTEGER DEFAULT 0,
         fail_count INTEGER DEFAULT 0,
-        status INTEGER DEFAULT 0,
+        status SMALLINT DEFAULT 0,
         last_checked TIMESTAMPTZ,
         last_success TIMESTAMPTZ,
         created_at TIMESTAMPTZ DEFAULT NOW(),
         updated_at TIMESTAMPTZ DEFAULT NOW(),
         UNIQUE(ip, port, protocol)
     );
+    DO $$
+    BEGIN
+        IF EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = 'proxies' AND column_name = 'status'
+                AND data_type = 'integer'
+        ) THEN
+            ALTER TABLE proxies ALTER COLUMN status TYPE SMALLINT;
+        END IF;
+    END $$;
     CREATE INDEX IF NOT EXISTS idx_proxies_country ON proxies(country);
     CREATE INDEX IF NOT EXISTS idx_proxies_protocol ON proxies(protocol);
     CREATE INDEX IF NOT EXISTS idx_proxies_status ON proxies(status);
-    CREATE INDEX IF NOT EXISTS idx_proxies_fail_count ON proxies(fail_count);
+    DROP INDEX IF EXISTS idx_proxies_fail_count;
     CREATE INDEX IF NOT EXISTS idx_proxies_last_success ON proxies(last_success);
+    CREATE INDEX IF NOT EXISTS idx_proxies_created_at ON proxies(created_at) WHERE last_success IS NULL;
     CREATE INDEX IF NOT EXISTS idx_proxies_quality ON proxies(success_count DESC, speed ASC);
+    CREATE INDEX IF NOT EXISTS idx_proxies_active_order ON proxies(last_success DESC, success_count DESC) WHERE status = 1;
+    CREATE INDEX IF NOT EXISTS idx_proxies_validation_queue ON proxies(last_checked ASC NULLS FIRST) WHERE status IN (0, 2);
+    CREATE INDEX IF NOT EXISTS idx_proxies_revalidation_queue ON proxies(last_checked ASC NULLS FIRST) WHERE status = 1;
+    CREATE INDEX IF NOT EXISTS idx_proxies_missing_country ON proxies(id) INCLUDE (ip) WHERE (country IS NULL OR country = '') AND status = 1;
+    CREATE MATERIALIZED VIEW IF NOT EXISTS proxy_stats AS
+        SELECT 1 AS id, NOW() AS refreshed_at, {PROXY_STATS_COLUMNS}
+        FROM proxies;
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_proxy_stats_id ON proxy_stats(id);
 """
-__all__ = ["__version__", "logger", "root_logger", "c", "CREATE_PROXY_TABLE"]
+__all__ = [
+    "__version__",
+    "logger",
+    "root_logger",
+    "c",
+    "PROXY_STATS_COLUMNS",
+    "CREATE_PROXY_TABLE",
+]
@@ -3,16 +3,158 @@
 Provides RESTful API endpoints for proxy management, validation, and statistics.
 """
 
+# Standard library imports
+import asyncio
+from typing import Optional, Tuple
+
 # Third-party imports
+import orjson
 from sanic import Blueprint, response
 from sanic.request import Request
 from scylla import logger
 
 # Local imports
+from scylla.core.cache import TTLCache
+from scylla.core.config import settings
+from scylla.core.database import db
+from scylla.models.proxy import ProxyAnonymity
 from scylla.services.proxy_service import proxy_service
 
 api_bp = Blueprint("api", url_prefix="/api")
 
+# Short-lived caches for hot read endpoints
+proxies_cache = TTLCache(maxsize=256, ttl=settings.proxies_cache_ttl)
+stats_cache = TTLCache(maxsize=1, ttl=settings.stats_cache_ttl)
+metrics_cache = TTLCache(maxsize=1, ttl=settings.metrics_cache_ttl)
+
+# Serializes metrics rebuilds so concurrent scrapes share one computation
+metrics_lock = asyncio.Lock()
+
+# curl_cffi session shared by /api/test requests, created lazily
+_test_session = None
+
+# In-flight get_stats query shared by concurrent callers
+_stats_inflight: Optional[asyncio.Future] = None
+
+# Allowed filter values and their precomputed error payloads
+ALLOWED_PROTOCOLS = frozenset(("http", "https", "socks4", "socks5"))
+ALLOWED_ANONYMITY = frozenset(a.value for a in ProxyAnonymity)
+PROTOCOL_ERROR = {
+    "success": False,
+    "error": f"Invalid parameter: protocol must be one of {sorted(ALLOWED_PROTOCOLS)}",
+}
+ANONYMITY_ERROR = {
+    "success": False,
+    "error": f"Invalid parameter: anonymity must be one of {sorted(ALLOWED_ANONYMITY)}",
+}
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 20
+
+# Static Prometheus exposition fragments; each one ends just before the
+# value that follows it, so the body is assembled without formatting lines
+METRIC_PROXIES_TOTAL = (
+    b"# HELP scylla_proxies_total Total number of proxies\n"
+    b"# TYPE scylla_proxies_total gauge\n"
+    b"scylla_proxies_total "
+)
+METRIC_PROXIES_ACTIVE = (
+    b"\n\n# HELP scylla_proxies_active Number of active proxies\n"
+    b"# TYPE scylla_proxies_active gauge\n"
+    b"scylla_proxies_active "
+)
+METRIC_PROXIES_INACTIVE = (
+    b"\n\n# HELP scylla_proxies_inactive Number of inactive proxies\n"
+    b"# TYPE scylla_proxies_inactive gauge\n"
+    b"scylla_proxies_inactive "
+)
+METRIC_PROXIES_PENDING = (
+    b"\n\n# HELP scylla_proxies_pending Number of pending proxies\n"
+    b"# TYPE scylla_proxies_pending gauge\n"
+    b"scylla_proxies_pending "
+)
+METRIC_ANONYMITY_TRANSPARENT = (
+    b"\n\n# HELP scylla_proxies_by_anonymity Proxies by anonymity level\n"
+    b"# TYPE scylla_proxies_by_anonymity gauge\n"
+    b'scylla_proxies_by_anonymity{level="transparent"} '
+)
+METRIC_ANONYMITY_ANONYMOUS = b'\nscylla_proxies_by_anonymity{level="anonymous"} '
+METRIC_ANONYMITY_ELITE = b'\nscylla_proxies_by_anonymity{level="elite"} '
+METRIC_AVG_SPEED = (
+    b"\n\n# HELP scylla_avg_speed_seconds Average proxy response speed\n"
+    b"# TYPE scylla_avg_speed_seconds gauge\n"
+    b"scylla_avg_speed_seconds "
+)
+METRIC_TASK_EXECUTIONS = (
+    b"\n\n# HELP scylla_task_executions_total Task execution counts\n"
+    b"# TYPE scylla_task_executions_total counter"
+)
+METRIC_TASK_RUNNING = (
+    b"\n\n# HELP scylla_task_running Task running status\n"
+    b"# TYPE scylla_task_running gauge"
+)
+
+
+def _parse_proxy_filters(args) -> Tuple[Optional[tuple], Optional[dict]]:
+    """Parse and normalize /api/proxies query parameters in one pass.
+
+    Args:
+        args: Request query arguments
+
+    Returns:
+        Tuple of (filters, error): filters is (protocol, country, anonymity,
+        limit), normalized so it can be used directly as a cache key; error is
+        a precomputed 400 payload when a filter value is not allowed
+
+    Raises:
+        ValueError: If limit is not an integer
+    """
+    get = args.get
+    protocol = get("protocol")
+    country = get("country")
+    anonymity = get("anonymity")
+    limit = get("limit")
+    limit = min(int(limit), MAX_LIMIT) if limit else DEFAULT_LIMIT
+
+    if protocol:
+        protocol = protocol.lower()
+        if protocol not in ALLOWED_PROTOCOLS:
+            return None, PROTOCOL_ERROR
+    if anonymity:
+        anonymity = anonymity.lower()
+        if anonymity not in ALLOWED_ANONYMITY:
+            return None, ANONYMITY_ERROR
+    if country:
+        country = country.upper()
+
+    return (protocol, country, anonymity, limit), None
+
+
+async def _load_stats() -> dict:
+    """Query pool statistics, coalescing concurrent callers into one query.
+
+    /api/stats misses and /api/metrics rebuilds that overlap await the same
+    database round-trip. The result refreshes stats_cache, which also feeds
+    the proxy count reported by /api/health.
+
+    Returns:
+        Statistics dictionary from proxy_service.get_stats()
+    """
+    global _stats_inflight
+    if _stats_inflight is None:
+        _stats_inflight = asyncio.ensure_future(proxy_service.get_stats())
+        _stats_inflight.add_done_callback(_clear_stats_inflight)
+
+    # Shield so one cancelled request does not cancel the shared query
+    stats = await asyncio.shield(_stats_inflight)
+    stats_cache.set("stats", stats)
+    return stats
+
+
+def _clear_stats_inflight(_future: asyncio.Future) -> None:
+    global _stats_inflight
+    _stats_inflight = None
+
 
 @api_bp.route("/proxies", methods=["GET"])
 async def get_proxies(request: Request):
@@ -22,32 +164,38 @@ async def get_proxies(request: Request):
         - protocol: Filter by protocol (http/https/socks4/socks5)
         - country: Filter by country code (ISO 3166-1 alpha-2, e.g., US, CN)
         - anonymity: Filter by anonymity level (transparent/anonymous/elite)
-        - limit: Maximum number of proxies to return (default: 10, max: 100)
+        - limit: Maximum number of proxies to return (default: 10, max: 20)
 
     Returns:
         JSON response with list of proxies
     """
     try:
-        protocol = request.args.get("protocol")
-        country = request.args.get("country")
-        anonymity = request.args.get("anonymity")
-        limit = min(int(request.args.get("limit", 10)), 20)
-
-        # Get proxies from service (filtering done at database level)
-        proxies = []
-        async for proxy in proxy_service.get_active_proxies(
-            protocol=protocol, country=country, anonymity=anonymity, limit=limit
-        ):
-            proxies.append(proxy.to_dict())
+        filters, error = _parse_proxy_filters(request.args)
+        if error:
+            # Reject unknown filters without touching the database
+            return response.json(error, status=400)
+
+        # Serve repeated filter combinations from the cached encoded body
+        body = proxies_cache.get(filters)
+        if body is None:
+            protocol, country, anonymity, limit = filters
+            # Get proxies from service (filtering done at database level)
+            proxies = await proxy_service.get_active_proxy_dicts(
+                protocol=protocol, country=country, anonymity=anonymity, limit=limit
+            )
+            body = orjson.dumps(
+                {"success": True, "count": len(proxies), "data": proxies}
+            )
+            proxies_cache.set(filters, body)
 
-        return response.json({"success": True, "count": len(proxies), "data": proxies})
+        return response.raw(body, content_type="application/json")
 
     except ValueError as e:
         return response.json(
             {"success": False, "error": f"Invalid parameter: {str(e)}"}, status=400
         )
     except Exception as e:
-        logger.error(f"Error in get_proxies: {e}", exc_info=True)
+        logger.error(f"Error in get_proxies: {e}", exc_info=settings.app_debug)
         return response.json({"success": False, "error": str(e)}, status=500)
 
 
@@ -67,11 +215,13 @@ async def get_stats(request: Request):
         - anonymity: Breakdown by anonymity level (transparent, anonymous, elite)
     """
     try:
-        stats = await proxy_service.get_stats()
+        stats = stats_cache.get("stats")
+        if stats is None:
+            stats = await _load_stats()
         return response.json({"success": True, "data": stats})
 
     except Exception as e:
-        logger.error(f"Error in get_stats: {e}", exc_info=True)
+        logger.error(f"Error in get_stats: {e}", exc_info=settings.app_debug)
         return response.json({"success": False, "error": str(e)}, status=500)
 
 
@@ -79,32 +229,74 @@ async def get_stats(request: Request):
 async def health_check(request: Request):
     """Health check endpoint.
 
+    Uses a cached liveness ping, and takes the proxy count from stats_cache
+    when it is warm. A cold cache is filled from the stats snapshot, so load
+    balancer polling does not aggregate the proxies table.
+
     Returns:
         JSON response with service health status
     """
-    try:
-        # Check database connection
-        stats = await proxy_service.get_stats()
-
+    if not await db.ping():
         return response.json(
-            {
-                "success": True,
-                "status": "healthy",
-                "database": "connected",
-                "proxy_count": stats.get("total", 0),
-            }
+            {"success": False, "status": "unhealthy", "database": "disconnected"},
+            status=503,
         )
+
+    try:
+        stats = stats_cache.get("stats")
+        if stats is None:
+            stats = await _load_stats()
     except Exception as e:
-        logger.error(f"Health check failed: {e}", exc_info=True)
+        logger.error(f"Health check failed: {e}", exc_info=settings.app_debug)
         return response.json(
             {"success": False, "status": "unhealthy", "error": str(e)}, status=503
         )
 
+    return response.json(
+        {
+            "success": True,
+            "status": "healthy",
+            "database": "connected",
+            "proxy_count": stats["total"],
+            "pool": db.pool_stats(),
+        }
+    )
+
+
+def _get_test_session():
+    """Get the process-wide curl_cffi session used by /api/test.
+
+    The session is created on first use; the proxy is chosen per request,
+    so one session can serve every test without rebuilding curl handles.
+    Response cookies are discarded so one client's test never sends
+    cookies set during another's. The curl handle pool is sized by
+    test_max_clients; callers beyond that wait for a free handle.
+
+    Returns:
+        Shared AsyncSession instance
+    """
+    global _test_session
+    if _test_session is None:
+        from curl_cffi import AsyncSession
+
+        _test_session = AsyncSession(
+            max_clients=settings.test_max_clients, discard_cookies=True
+        )
+    return _test_session
+
+
+@api_bp.listener("before_server_stop")
+async def close_test_session(app, _loop) -> None:
+    """Close the shared /api/test session on shutdown."""
+    global _test_session
+    if _test_session is not None:
+        await _test_session.close()
+        _test_session = None
+
 
 @api_bp.route("/test", methods=["POST"])
 async def test_proxy(request: Request):
     import time
-    from curl_cffi import AsyncSession
 
     try:
         # Parse form data
@@ -113,7 +305,9 @@ async def test_proxy(request: Request):
             raise ValueError("Missing 'proxy' parameter in form data")
 
         test_url = request.form.get("test_url", "https://ipinfo.io/")
-        timeout_seconds = int(request.form.get("timeout", 20))
+        timeout_seconds = min(
+            max(int(request.form.get("timeout", 20)), 1), settings.test_max_timeout
+        )
 
         # Test the proxy
         start_time = time.time()
@@ -126,28 +320,86 @@ async def test_proxy(request: Request):
             "error": None,
         }
 
-        async with AsyncSession() as session:
-            resp = await session.request(
+        # wait_for also bounds the time spent waiting for a pooled handle
+        resp = await asyncio.wait_for(
+            _get_test_session().request(
                 method="GET",
                 url=test_url,
                 proxy=proxy_url,
                 timeout=timeout_seconds,
                 verify=False,
                 headers={"user-agent": "curl/7.88.1"},
-            )
+            ),
+            timeout=timeout_seconds,
+        )
 
-            response_time = time.time() - start_time
-            test_result["speed"] = round(response_time, 2)
-            test_result["working"] = resp.ok
-            test_result["headers"] = dict(resp.headers)
-            test_result["data"] = resp.json()
+        response_time = time.time() - start_time
+        test_result["speed"] = round(response_time, 2)
+        test_result["working"] = resp.ok
+        test_result["headers"] = dict(resp.headers)
+        test_result["data"] = resp.json()
 
+    except asyncio.TimeoutError:
+        test_result["error"] = f"Timed out after {timeout_seconds}s"
     except Exception as e:
         test_result["error"] = str(e)
 
     return response.json({"success": True, "data": test_result})
 
 
+async def _build_metrics() -> bytes:
+    """Build the Prometheus exposition body from current stats and tasks.
+
+    Returns:
+        UTF-8 encoded metrics text in Prometheus format
+    """
+    from scylla.core.scheduler import scheduler
+
+    stats = await _load_stats()
+    anonymity = stats["anonymity"]
+
+    buf = bytearray()
+    w = buf.extend
+
+    w(METRIC_PROXIES_TOTAL)
+    w(str(stats["total"]).encode())
+    w(METRIC_PROXIES_ACTIVE)
+    w(str(stats["active"]).encode())
+    w(METRIC_PROXIES_INACTIVE)
+    w(str(stats["inactive"]).encode())
+    w(METRIC_PROXIES_PENDING)
+    w(str(stats["checking"]).encode())
+    w(METRIC_ANONYMITY_TRANSPARENT)
+    w(str(anonymity["transparent"]).encode())
+    w(METRIC_ANONYMITY_ANONYMOUS)
+    w(str(anonymity["anonymous"]).encode())
+    w(METRIC_ANONYMITY_ELITE)
+    w(str(anonymity["elite"]).encode())
+    w(METRIC_AVG_SPEED)
+    w(str(stats["avg_speed"] or 0).encode())
+    w(METRIC_TASK_EXECUTIONS)
+
+    tasks = scheduler.tasks
+    for task in tasks:
+        task_name = task.metric_name
+        w(b'\nscylla_task_executions_total{task="')
+        w(task_name)
+        w(b'",status="success"} ')
+        w(str(task.execution_count).encode())
+        w(b'\nscylla_task_executions_total{task="')
+        w(task_name)
+        w(b'",status="failure"} ')
+        w(str(task.failure_count).encode())
+
+    w(METRIC_TASK_RUNNING)
+    for task in tasks:
+        w(b'\nscylla_task_running{task="')
+        w(task.metric_name)
+        w(b'"} 1' if task.is_running else b'"} 0')
+
+    return bytes(buf)
+
+
 @api_bp.route("/metrics", methods=["GET"])
 async def get_metrics(request: Request):
     """Get system metrics in Prometheus-compatible format.
@@ -155,71 +407,20 @@ async def get_metrics(request: Request):
     Returns:
         Plain text metrics for Prometheus scraping
     """
-    from scylla.core.scheduler import scheduler
-
     try:
-        stats = await proxy_service.get_stats()
-        tasks_status = list(scheduler.get_tasks_status())
-
-        # Build Prometheus-style metrics
-        lines = [
-            "# HELP scylla_proxies_total Total number of proxies",
-            "# TYPE scylla_proxies_total gauge",
-            f'scylla_proxies_total {stats["total"]}',
-            "",
-            "# HELP scylla_proxies_active Number of active proxies",
-            "# TYPE scylla_proxies_active gauge",
-            f'scylla_proxies_active {stats["active"]}',
-            "",
-            "# HELP scylla_proxies_inactive Number of inactive proxies",
-            "# TYPE scylla_proxies_inactive gauge",
-            f'scylla_proxies_inactive {stats["inactive"]}',
-            "",
-            "# HELP scylla_proxies_pending Number of pending proxies",
-            "# TYPE scylla_proxies_pending gauge",
-            f'scylla_proxies_pending {stats["checking"]}',
-            "",
-            "# HELP scylla_proxies_by_anonymity Proxies by anonymity level",
-            "# TYPE scylla_proxies_by_anonymity gauge",
-            f'scylla_proxies_by_anonymity{{level="transparent"}} {stats["anonymity"]["transparent"]}',
-            f'scylla_proxies_by_anonymity{{level="anonymous"}} {stats["anonymity"]["anonymous"]}',
-            f'scylla_proxies_by_anonymity{{level="elite"}} {stats["anonymity"]["elite"]}',
-            "",
-            "# HELP scylla_avg_speed_seconds Average proxy response speed",
-            "# TYPE scylla_avg_speed_seconds gauge",
-            f'scylla_avg_speed_seconds {stats["avg_speed"] or 0}',
-            "",
-            "# HELP scylla_task_executions_total Task execution counts",
-            "# TYPE scylla_task_executions_total counter",
-        ]
-
-        for task in tasks_status:
-            task_name = task["name"].lower().replace(" ", "_")
-            lines.append(
-                f'scylla_task_executions_total{{task="{task_name}",status="success"}} {task["execution_count"]}'
-            )
-            lines.append(
-                f'scylla_task_executions_total{{task="{task_name}",status="failure"}} {task["failure_count"]}'
-            )
-
-        lines.extend(
-            [
-                "",
-                "# HELP scylla_task_running Task running status",
-                "# TYPE scylla_task_running gauge",
-            ]
-        )
-
-        for task in tasks_status:
-            task_name = task["name"].lower().replace(" ", "_")
-            lines.append(
-                f'scylla_task_running{{task="{task_name}"}} {1 if task["is_running"] else 0}'
-            )
+        body = metrics_cache.get("metrics")
+        if body is None:
+            async with metrics_lock:
+                # Another scrape may have rebuilt the body while we waited
+                body = metrics_cache.get("metrics")
+                if body is None:
+                    body = await _build_metrics()
+                    metrics_cache.set("metrics", body)
 
-        return response.text("\n".join(lines), content_type="text/plain; charset=utf-8")
+        return response.raw(body, content_type="text/plain; charset=utf-8")
 
     except Exception as e:
-        logger.error(f"Error in get_metrics: {e}", exc_info=True)
+        logger.error(f"Error in get_metrics: {e}", exc_info=settings.app_debug)
         return response.text(f"# Error: {e}", status=500)
 
 
@@ -236,5 +437,5 @@ async def get_tasks_status(request: Request):
         tasks = list(scheduler.get_tasks_status())
         return response.json({"success": True, "data": tasks})
     except Exception as e:
-        logger.error(f"Error in get_tasks_status: {e}", exc_info=True)
+        logger.error(f"Error in get_tasks_status: {e}", exc_info=settings.app_debug)
         return response.json({"success": False, "error": str(e)}, status=500)
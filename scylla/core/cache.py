@@ -0,0 +1,64 @@
+"""TTL Cache Module
+
+Provides a small in-process cache with per-entry expiry for hot API reads.
+"""
+
+# Standard library imports
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """Bounded in-process cache whose entries expire after a fixed TTL.
+
+    Entries are evicted oldest-first once maxsize is exceeded. A TTL of 0
+    disables caching entirely.
+
+    Attributes:
+        maxsize: Maximum number of cached entries
+        ttl: Entry lifetime in seconds
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 15):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        item = self._data.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value under key for ttl seconds.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        if self.ttl <= 0:
+            return
+
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._data.clear()
@@ -15,19 +15,38 @@ class Settings(BaseSettings):
 
     # Database settings
     db_url: str = Field(default="postgresql://", description="Database connection URL")
+    db_read_url: str = Field(
+        default="",
+        description="Read replica connection URL for API reads (empty uses db_url)",
+    )
     db_min_pool_size: int = Field(
         default=2, ge=1, description="Minimum database connection pool size"
     )
     db_max_pool_size: int = Field(
         default=10, ge=1, description="Maximum database connection pool size"
     )
+    db_max_inactive_lifetime: float = Field(
+        default=300.0,
+        ge=0,
+        description="Seconds before idle pool connections are closed (0 disables)",
+    )
+    db_statement_cache_size: int = Field(
+        default=1024,
+        ge=0,
+        description="Prepared statements cached per connection (0 disables)",
+    )
 
     # Application settings
     app_host: str = Field(default="0.0.0.0", description="Application host")
     app_port: int = Field(default=8000, ge=1, le=65535, description="Application port")
     app_debug: bool = Field(default=False, description="Debug mode")
     app_secret: str = Field(default="", description="Application secret key")
-    app_worker: int = Field(default=1, ge=1, le=20, description="Application workers")
+    app_worker: int = Field(
+        default=1, ge=0, le=20, description="Application workers (0 = one per CPU)"
+    )
+    use_uvloop: bool = Field(
+        default=True, description="Use uvloop as the event loop when available"
+    )
 
     # Scheduler intervals (in seconds)
     crawl_interval: int = Field(
@@ -45,6 +64,9 @@ class Settings(BaseSettings):
     update_country_interval: int = Field(
         default=600, ge=1, description="Country update interval in seconds"
     )
+    stats_refresh_interval: int = Field(
+        default=30, ge=1, description="Proxy statistics refresh interval in seconds"
+    )
 
     # Limits
     max_fail_count: int = Field(
@@ -69,6 +91,25 @@ class Settings(BaseSettings):
         description="URLs used for proxy validation (randomly selected)",
     )
 
+    # /api/test endpoint
+    test_max_clients: int = Field(
+        default=20, ge=1, description="Concurrent /api/test requests per worker"
+    )
+    test_max_timeout: int = Field(
+        default=30, ge=1, description="Upper bound for the /api/test timeout"
+    )
+
+    # API response cache (in seconds, 0 disables)
+    proxies_cache_ttl: int = Field(
+        default=15, ge=0, description="TTL for cached /api/proxies results"
+    )
+    stats_cache_ttl: int = Field(
+        default=60, ge=0, description="TTL for cached /api/stats results"
+    )
+    metrics_cache_ttl: int = Field(
+        default=10, ge=0, description="TTL for cached /api/metrics output"
+    )
+
     # Logging format
     log_format: str = Field(
         default="\033[38;5;240m%(asctime)s\033[0m %(levelname)s: \033[1000D\033[26C\033[K %(message)s",
@@ -79,6 +120,20 @@ class Settings(BaseSettings):
     redis_url: str = Field(
         default="redis://localhost:6379/0", description="Redis connection URL"
     )
+    redis_max_connections: int = Field(
+        default=20, ge=1, description="Maximum Redis pool connections"
+    )
+    redis_socket_connect_timeout: float = Field(
+        default=2.0, gt=0, description="Seconds to wait when connecting to Redis"
+    )
+    redis_socket_timeout: float = Field(
+        default=5.0, gt=0, description="Seconds to wait for a Redis reply"
+    )
+    redis_pool_timeout: float = Field(
+        default=5.0,
+        gt=0,
+        description="Seconds to wait for a free Redis connection before failing",
+    )
 
     @model_validator(mode="after")
     def validate_pool_sizes(self) -> "Settings":
@@ -1,16 +1,38 @@
+# Standard library imports
+import asyncio
+import time
+from collections import deque
+from typing import Optional, List, Dict, Any, Tuple
+
 # Third-party imports
 import asyncpg
-from typing import Optional, List
 
 # Local imports
 from scylla.core.config import settings
 from scylla.models import Proxy
 from scylla import CREATE_PROXY_TABLE, logger
 
+# Seconds a liveness ping result is reused before pinging again
+HEALTH_TTL = 5.0
+
+# Recent acquire wait times kept per pool for the p95 estimate
+ACQUIRE_SAMPLES = 1024
+
 
 class Database:
     def __init__(self):
         self.pool: Optional[asyncpg.Pool] = None
+        # Pool for read-only API queries; same as pool unless a replica is set
+        self.read_pool: Optional[asyncpg.Pool] = None
+        # Last ping result as (healthy, monotonic timestamp)
+        self._health: Optional[Tuple[bool, float]] = None
+        # Per pool: ring buffer of acquire waits (seconds) and the number of
+        # acquires that found every connection busy at max_size
+        self._acquire_waits = {
+            "primary": deque(maxlen=ACQUIRE_SAMPLES),
+            "read": deque(maxlen=ACQUIRE_SAMPLES),
+        }
+        self._exhausted = {"primary": 0, "read": 0}
 
     async def connect(self):
         """Create database connection pool with initialization."""
@@ -23,9 +45,23 @@ class Database:
                 settings.db_url,
                 min_size=settings.db_min_pool_size,
                 max_size=settings.db_max_pool_size,
+                max_inactive_connection_lifetime=settings.db_max_inactive_lifetime,
+                statement_cache_size=settings.db_statement_cache_size,
             )
             await self.init_tables()
             logger.debug("✓ Database connection pool created")
+
+            if settings.db_read_url:
+                self.read_pool = await asyncpg.create_pool(
+                    settings.db_read_url,
+                    min_size=settings.db_min_pool_size,
+                    max_size=settings.db_max_pool_size,
+                    max_inactive_connection_lifetime=settings.db_max_inactive_lifetime,
+                    statement_cache_size=settings.db_statement_cache_size,
+                )
+                logger.debug("✓ Database read replica pool created")
+            else:
+                self.read_pool = self.pool
         except Exception as e:
             logger.error(f"Failed to connect to database: {e}", exc_info=True)
             raise
@@ -36,7 +72,15 @@ class Database:
             await conn.execute(CREATE_PROXY_TABLE)
 
     async def close(self):
-        """Close database connection pool gracefully."""
+        """Close database connection pools gracefully."""
+        if self.read_pool is not None and self.read_pool is not self.pool:
+            try:
+                await self.read_pool.close()
+                logger.debug("✓ Database read replica pool closed")
+            except Exception as e:
+                logger.error(f"Error closing database read pool: {e}")
+        self.read_pool = None
+
         if self.pool:
             try:
                 await self.pool.close()
@@ -46,21 +90,113 @@ class Database:
             finally:
                 self.pool = None
 
+    async def ping(self, timeout: float = 1.0) -> bool:
+        """Check database liveness, reusing a result younger than HEALTH_TTL.
+
+        Frequent health checks therefore cost at most one SELECT 1 per
+        HEALTH_TTL seconds instead of competing with API traffic.
+
+        Args:
+            timeout: Seconds to wait for the ping before reporting failure
+
+        Returns:
+            True if the database answered, False otherwise
+        """
+        now = time.monotonic()
+        if self._health is not None and now - self._health[1] < HEALTH_TTL:
+            return self._health[0]
+
+        healthy = False
+        if self.pool is not None:
+            try:
+                await asyncio.wait_for(self.pool.fetchval("SELECT 1"), timeout)
+                healthy = True
+            except Exception as e:
+                logger.debug(f"Database ping failed: {e}")
+
+        self._health = (healthy, now)
+        return healthy
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Get connection pool utilisation for sizing decisions.
+
+        A pool whose idle count stays at 0 while size equals max_size is
+        saturated and requests are queueing for a connection; a rising
+        exhausted count and acquire wait confirm it.
+
+        Returns:
+            Dictionary with size, idle, in-use, max size, p95 acquire wait
+            and exhaustion count per pool
+        """
+        stats = {}
+        for name, pool in (("primary", self.pool), ("read", self.read_pool)):
+            if pool is None or (name == "read" and pool is self.pool):
+                continue
+            size = pool.get_size()
+            idle = pool.get_idle_size()
+            waits = sorted(self._acquire_waits[name])
+            p95 = waits[int(0.95 * (len(waits) - 1))] if waits else 0.0
+            stats[name] = {
+                "size": size,
+                "idle": idle,
+                "in_use": size - idle,
+                "max_size": pool.get_max_size(),
+                "acquire_wait_p95_ms": round(p95 * 1000, 2),
+                "exhausted": self._exhausted[name],
+            }
+        return stats
+
+    async def _run(self, name: str, pool: asyncpg.Pool, method: str, query, args):
+        """Run one query on a pooled connection, recording the acquire wait.
+
+        Args:
+            name: Pool name for the statistics ("primary" or "read")
+            pool: Pool to acquire the connection from
+            method: Connection method to call (execute, fetch, ...)
+            query: SQL query
+            args: Query arguments
+
+        Returns:
+            Result of the connection method
+        """
+        if pool.get_idle_size() == 0 and pool.get_size() >= pool.get_max_size():
+            self._exhausted[name] += 1
+
+        started = time.monotonic()
+        conn = await pool.acquire()
+        self._acquire_waits[name].append(time.monotonic() - started)
+        try:
+            return await getattr(conn, method)(query, *args)
+        finally:
+            await pool.release(conn)
+
+    # One-shot query helpers; each acquires and releases a connection
     async def execute(self, query: str, *args):
-        async with self.pool.acquire() as conn:
-            return await conn.execute(query, *args)
+        return await self._run("primary", self.pool, "execute", query, args)
 
     async def fetch(self, query: str, *args):
-        async with self.pool.acquire() as conn:
-            return await conn.fetch(query, *args)
+        return await self._run("primary", self.pool, "fetch", query, args)
 
     async def fetchrow(self, query: str, *args):
-        async with self.pool.acquire() as conn:
-            return await conn.fetchrow(query, *args)
+        return await self._run("primary", self.pool, "fetchrow", query, args)
 
     async def fetchval(self, query: str, *args):
-        async with self.pool.acquire() as conn:
-            return await conn.fetchval(query, *args)
+        return await self._run("primary", self.pool, "fetchval", query, args)
+
+    # Read-only variants routed to the replica pool when one is configured
+    def _read_target(self) -> Tuple[str, asyncpg.Pool]:
+        """Get the (name, pool) pair read queries are sent to."""
+        if self.read_pool is self.pool:
+            return "primary", self.pool
+        return "read", self.read_pool
+
+    async def fetch_read(self, query: str, *args):
+        name, pool = self._read_target()
+        return await self._run(name, pool, "fetch", query, args)
+
+    async def fetchrow_read(self, query: str, *args):
+        name, pool = self._read_target()
+        return await self._run(name, pool, "fetchrow", query, args)
 
 
 db = Database()
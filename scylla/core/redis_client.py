@@ -5,19 +5,26 @@ Provides Redis connection and operations for task scheduling.
 
 # Standard library imports
 import asyncio
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
 # Third-party imports
+import orjson
 import redis.asyncio as redis
 
 # Local imports
 from scylla import logger
 from scylla.core.config import settings
 
+# Redis key prefix; each key holds one orjson-encoded task state blob
+KEY_TASK_STATS = "task:state:{}"
 
-# Redis key prefix
-KEY_TASK_STATS = "task:stats:{}"
+# Takes the lock in KEYS[1] (SET NX EX ARGV[1]) and returns whether it was
+# acquired together with MGET of the remaining keys, in one round-trip
+LOCK_AND_MGET_SCRIPT = """
+local acquired = redis.call('SET', KEYS[1], 1, 'NX', 'EX', ARGV[1]) and 1 or 0
+return {acquired, redis.call('MGET', unpack(KEYS, 2))}
+"""
 
 
 class RedisClient:
@@ -30,6 +37,7 @@ class RedisClient:
     def __init__(self):
         """Initialize Redis client."""
         self.client: Optional[redis.Redis] = None
+        self._lock_and_mget = None
 
     @property
     def is_connected(self) -> bool:
@@ -40,15 +48,23 @@ class RedisClient:
         """Connect to Redis server with connection pool configuration."""
 
         try:
-            self.client = await redis.from_url(
+            # Blocking pool: callers wait up to redis_pool_timeout for a free
+            # connection instead of failing with "Too many connections".
+            # Replies stay bytes; task state blobs go straight to orjson.
+            pool = redis.BlockingConnectionPool.from_url(
                 settings.redis_url,
-                encoding="utf-8",
-                decode_responses=True,
-                max_connections=10,
+                max_connections=settings.redis_max_connections,
+                timeout=settings.redis_pool_timeout,
+                health_check_interval=30,
                 socket_keepalive=True,
-                socket_connect_timeout=20,
+                socket_connect_timeout=settings.redis_socket_connect_timeout,
+                socket_timeout=settings.redis_socket_timeout,
                 retry_on_timeout=True,
             )
+            # from_pool hands pool ownership to the client, so close() frees it
+            self.client = redis.Redis.from_pool(pool)
+            # Loaded lazily via EVALSHA, falling back to EVAL on first use
+            self._lock_and_mget = self.client.register_script(LOCK_AND_MGET_SCRIPT)
             await self.client.ping()
             logger.debug("✓ Redis connected")
         except Exception as e:
@@ -56,20 +72,17 @@ class RedisClient:
             self.client = None
 
     async def ensure_connected(self) -> bool:
-        """Ensure Redis connection is available, reconnect if needed.
+        """Ensure a Redis client exists, connecting if needed.
+
+        No PING is issued per operation: the pool's health_check_interval
+        verifies idle connections, and redis-py reconnects and retries
+        commands that hit a dropped connection.
 
         Returns:
             True if connected, False otherwise
         """
-        if self.client:
-            try:
-                await self.client.ping()
-                return True
-            except Exception:
-                logger.warning("Redis connection lost, attempting to reconnect...")
-                await self.close()
-
-        await self.connect()
+        if self.client is None:
+            await self.connect()
         return self.is_connected
 
     async def close(self) -> None:
@@ -83,40 +96,59 @@ class RedisClient:
                 self.client = None
                 logger.debug("✓ Redis closed")
 
-    async def get_task_stats(self, task_name: str) -> Optional[Dict[str, Any]]:
-        """Get task statistics and schedule from Redis.
+    async def acquire_lock_with_task_stats(
+        self, lock_key: str, ttl: int, task_names: List[str]
+    ) -> Tuple[bool, List[Optional[Dict[str, Any]]]]:
+        """Try to take a lock and fetch task statistics in one round-trip.
 
         Args:
-            task_name: Name of the task
+            lock_key: Key of the lock to set if absent
+            ttl: Lock expiry in seconds
+            task_names: Names of the tasks whose state to fetch
 
         Returns:
-            Dictionary with task statistics and schedule or None if not found
+            Tuple of (acquired, stats) where stats is aligned with task_names;
+            (False, all None) if Redis is unavailable
         """
         if not await self.ensure_connected():
-            return None
+            return False, [None] * len(task_names)
 
+        keys = [lock_key]
+        keys.extend(KEY_TASK_STATS.format(name) for name in task_names)
         try:
-            stats_key = KEY_TASK_STATS.format(task_name)
-            stats = await self.client.hgetall(stats_key)
-            if stats:
-                return {
-                    "execution_count": int(stats.get("execution_count", 0)),
-                    "failure_count": int(stats.get("failure_count", 0)),
-                    "last_run": (
-                        datetime.fromisoformat(stats["last_run"])
-                        if stats.get("last_run")
-                        else None
-                    ),
-                    "next_run": (
-                        datetime.fromisoformat(stats["next_run"])
-                        if stats.get("next_run")
-                        else None
-                    ),
-                }
+            acquired, blobs = await self._lock_and_mget(keys=keys, args=[ttl])
         except Exception as e:
-            logger.debug(f"Failed to get task stats for {task_name}: {e}")
+            logger.warning(f"Failed to acquire lock {lock_key}: {e}")
+            return False, [None] * len(task_names)
+
+        stats = []
+        for name, raw in zip(task_names, blobs):
+            try:
+                stats.append(self._parse_task_stats(raw) if raw else None)
+            except Exception as e:
+                logger.debug(f"Failed to parse task stats for {name}: {e}")
+                stats.append(None)
+        return bool(acquired), stats
+
+    @staticmethod
+    def _parse_task_stats(raw) -> Dict[str, Any]:
+        """Decode a stored task state blob.
+
+        Args:
+            raw: orjson-encoded task state bytes
 
-        return None
+        Returns:
+            Dictionary with execution counters and run timestamps
+        """
+        stats = orjson.loads(raw)
+        last_run = stats.get("last_run")
+        next_run = stats.get("next_run")
+        return {
+            "execution_count": stats.get("execution_count", 0),
+            "failure_count": stats.get("failure_count", 0),
+            "last_run": datetime.fromisoformat(last_run) if last_run else None,
+            "next_run": datetime.fromisoformat(next_run) if next_run else None,
+        }
 
     async def update_task_info_batch(
         self,
@@ -128,7 +160,7 @@ class RedisClient:
         execution_time: float,
         ttl: int = 86400,
     ) -> None:
-        """Batch update task information using pipeline.
+        """Store task information as a single blob with one SET command.
 
         Args:
             task_name: Task name
@@ -137,26 +169,23 @@ class RedisClient:
             execution_count: Number of executions
             failure_count: Number of failures
             execution_time: Execution time in seconds
-            ttl: TTL for all keys in seconds (default: 24 hours)
+            ttl: TTL for the key in seconds (default: 24 hours)
         """
         if not await self.ensure_connected():
             return
 
         try:
-            # 使用 pipeline 减少网络往返
-            stats = {
-                "last_run": last_run.isoformat() if last_run else "",
-                "next_run": next_run.isoformat(),
-                "execution_count": str(execution_count),
-                "failure_count": str(failure_count),
-                "execution_time": f"{execution_time:.2f}",
-            }
-            stats_key = KEY_TASK_STATS.format(task_name)
-
-            async with self.client.pipeline(transaction=False) as pipe:
-                await pipe.hset(stats_key, mapping=stats)  # type: ignore
-                await pipe.expire(stats_key, ttl)
-                await pipe.execute()
+            # orjson encodes datetimes as ISO 8601 and numbers natively
+            payload = orjson.dumps(
+                {
+                    "last_run": last_run,
+                    "next_run": next_run,
+                    "execution_count": execution_count,
+                    "failure_count": failure_count,
+                    "execution_time": round(execution_time, 2),
+                }
+            )
+            await self.client.set(KEY_TASK_STATS.format(task_name), payload, ex=ttl)
         except Exception as e:
             logger.debug(f"Failed to update task info for {task_name}: {e}")
 
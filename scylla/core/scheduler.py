@@ -6,20 +6,24 @@ error recovery, and concurrent execution support.
 
 # Standard library imports
 import asyncio
+import logging
+import time
 from datetime import datetime, timedelta
-from typing import Callable, List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any, Set
 
 # Local imports
 from scylla import logger, root_logger, c
 from scylla.core.config import settings
 from scylla.core.database import db
 from scylla.core.redis_client import redis_client
+from scylla.services.validator_service import validator_service
 from scylla.tasks import (
     crawl_task,
     validate_pending_task,
     validate_success_task,
     cleanup_task,
     update_country_task,
+    stats_refresh_task,
 )
 
 
@@ -32,20 +36,63 @@ class Task:
         interval: Time interval in seconds between executions
         last_run: Timestamp of the last successful execution
         next_run: Timestamp of the next scheduled execution
-        is_running: Flag to prevent concurrent executions of the same task
+        is_running: Whether the task's lock is held by an in-progress execution
+        metric_name: Prometheus label value for the task, pre-encoded
         execution_count: Total number of successful executions
         failure_count: Total number of failed executions
     """
 
+    __slots__ = (
+        "name",
+        "func",
+        "interval",
+        "execution_count",
+        "failure_count",
+        "metric_name",
+        "_last_run",
+        "_last_run_iso",
+        "_next_run",
+        "_next_run_iso",
+        "_lock",
+        "_log_prefix",
+    )
+
     def __init__(self, name: str, func: Callable, interval: int):
         self.name = name
         self.func = func
         self.interval = interval
-        self.last_run: Optional[datetime] = None
-        self.next_run: Optional[datetime] = None
-        self.is_running = False
+        self.last_run = None
+        self.next_run = None
         self.execution_count = 0
         self.failure_count = 0
+        self._lock = asyncio.Lock()
+        self._log_prefix = f"[{c.BLUE}{name}{c.END}]"
+        self.metric_name = name.lower().replace(" ", "_").encode()
+
+    # last_run/next_run keep their ISO strings alongside, so status
+    # requests reuse them instead of formatting both timestamps each time
+    @property
+    def last_run(self) -> Optional[datetime]:
+        return self._last_run
+
+    @last_run.setter
+    def last_run(self, value: Optional[datetime]) -> None:
+        self._last_run = value
+        self._last_run_iso = value.isoformat() if value else None
+
+    @property
+    def next_run(self) -> Optional[datetime]:
+        return self._next_run
+
+    @next_run.setter
+    def next_run(self, value: Optional[datetime]) -> None:
+        self._next_run = value
+        self._next_run_iso = value.isoformat() if value else None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether an execution of this task is currently in progress."""
+        return self._lock.locked()
 
     async def run(self) -> None:
         """Execute the task with concurrency protection and improved scheduling.
@@ -53,57 +100,51 @@ class Task:
         Skips execution if the previous run is still in progress to prevent
         overlapping executions. Logs execution lifecycle and captures errors.
 
-        Uses fixed-interval scheduling to prevent time drift accumulation.
+        The scheduler sets next_run before each run; it is persisted to Redis
+        together with the execution statistics once the run finishes.
         """
-        colored_name = f"{c.BLUE}{self.name}{c.END}"
-        if self.is_running:
-            logger.warning(
-                f"[{colored_name}] Previous execution still running, skipping"
-            )
+        prefix = self._log_prefix
+        if self._lock.locked():
+            logger.warning(f"{prefix} Previous execution still running, skipping")
             return
 
-        self.is_running = True
-        start_time = datetime.now()
-        execution_time = 0.0
-
-        try:
-            root_logger.debug(f"[{colored_name}] Execution started")
-            await self.func()
-
-            execution_time = (datetime.now() - start_time).total_seconds()
-            self.last_run = start_time  # Use start time instead of end time
-            self.execution_count += 1
-
-            logger.info(
-                f"[{colored_name}] {c.GREEN}✓{c.END} Completed in {execution_time:.2f}s "
-                f"(total: {self.execution_count}, failures: {self.failure_count})"
-            )
-
-        except Exception as e:
-            self.failure_count += 1
-            execution_time = (datetime.now() - start_time).total_seconds()
-
-            logger.error(
-                f"[{colored_name}] {c.RED}✗{c.END} Failed after {execution_time:.2f}s: {e}",
-                exc_info=True,
-            )
-
-        finally:
-            self.is_running = False
-
-            if self.next_run:
-                self.next_run = self.next_run + timedelta(seconds=self.interval)
-            else:
-                self.next_run = start_time + timedelta(seconds=self.interval)
-
-            await redis_client.update_task_info_batch(
-                task_name=self.name,
-                next_run=self.next_run,
-                last_run=self.last_run,
-                execution_count=self.execution_count,
-                failure_count=self.failure_count,
-                execution_time=execution_time,
-            )
+        async with self._lock:
+            start_time = datetime.now()
+            started = time.monotonic()
+            execution_time = 0.0
+
+            try:
+                if root_logger.isEnabledFor(logging.DEBUG):
+                    root_logger.debug(f"{prefix} Execution started")
+                await self.func()
+
+                execution_time = time.monotonic() - started
+                self.last_run = start_time  # Use start time instead of end time
+                self.execution_count += 1
+
+                logger.info(
+                    f"{prefix} {c.GREEN}✓{c.END} Completed in {execution_time:.2f}s "
+                    f"(total: {self.execution_count}, failures: {self.failure_count})"
+                )
+
+            except Exception as e:
+                self.failure_count += 1
+                execution_time = time.monotonic() - started
+
+                logger.error(
+                    f"{prefix} {c.RED}✗{c.END} Failed after {execution_time:.2f}s: {e}",
+                    exc_info=True,
+                )
+
+            finally:
+                await redis_client.update_task_info_batch(
+                    task_name=self.name,
+                    next_run=self.next_run,
+                    last_run=self.last_run,
+                    execution_count=self.execution_count,
+                    failure_count=self.failure_count,
+                    execution_time=execution_time,
+                )
 
     def get_status(self) -> Dict[str, Any]:
         """Get current task status and statistics.
@@ -114,8 +155,8 @@ class Task:
         return {
             "name": self.name,
             "interval": self.interval,
-            "last_run": self.last_run.isoformat() if self.last_run else None,
-            "next_run": self.next_run.isoformat() if self.next_run else None,
+            "last_run": self._last_run_iso,
+            "next_run": self._next_run_iso,
             "is_running": self.is_running,
             "execution_count": self.execution_count,
             "failure_count": self.failure_count,
@@ -125,9 +166,12 @@ class Task:
 class Scheduler:
     """Manages and executes multiple scheduled tasks concurrently.
 
-    The scheduler runs each task in its own coroutine, allowing independent
-    execution cycles. Tasks are executed immediately on startup, then repeat
-    at their configured intervals.
+    Each task is armed with a loop.call_at timer at an absolute deadline on
+    the event loop's monotonic clock. When the timer fires, the task is
+    spawned in the background and the next timer is armed, so no coroutine
+    sleeps between runs and long-running tasks never delay others.
+    Tasks are executed immediately on startup (unless a future next_run was
+    restored from Redis), then repeat at their configured intervals.
 
     Attributes:
         tasks: List of registered Task instances
@@ -137,6 +181,9 @@ class Scheduler:
     def __init__(self):
         self.tasks: List[Task] = []
         self.running = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._handles: Dict[str, asyncio.TimerHandle] = {}
+        self._inflight: Set[asyncio.Task] = set()
 
     def add_task(self, name: str, func: Callable, interval: int) -> Task:
         """Register a new scheduled task.
@@ -153,40 +200,50 @@ class Scheduler:
         self.tasks.append(task)
         return task
 
-    async def _initialize_tasks(self) -> None:
-        lock_key = "scheduler:task_initialization"
-        if await redis_client.client.set(lock_key, 1, ex=60, nx=True):
-            self.add_task(
-                name="Proxy Crawl",
-                func=crawl_task,
-                interval=settings.crawl_interval,
-            )
-
-            self.add_task(
-                name="Proxy Cleanup",
-                func=cleanup_task,
-                interval=settings.cleanup_interval,
-            )
-
-            self.add_task(
-                name="Country Update",
-                func=update_country_task,
-                interval=settings.update_country_interval,
-            )
-
-            self.add_task(
-                name="Success Proxy Validation",
-                func=validate_success_task,
-                interval=settings.validate_success_interval,
-            )
+    async def _initialize_tasks(self) -> List[Optional[Dict[str, Any]]]:
+        """Register tasks under the distributed initialization lock.
 
+        Shared tasks are registered only by the worker that acquires the
+        lock; every worker gets its own pending validation task. The lock and
+        the persisted state of all candidate tasks are fetched together in a
+        single Redis round-trip.
+
+        Returns:
+            Persisted task state aligned with self.tasks (None if absent)
+        """
+        shared_tasks = [
+            ("Proxy Crawl", crawl_task, settings.crawl_interval),
+            ("Proxy Cleanup", cleanup_task, settings.cleanup_interval),
+            ("Country Update", update_country_task, settings.update_country_interval),
+            (
+                "Success Proxy Validation",
+                validate_success_task,
+                settings.validate_success_interval,
+            ),
+            ("Stats Refresh", stats_refresh_task, settings.stats_refresh_interval),
+        ]
         # Each worker gets its own pending validation task
-        self.add_task(
-            name="Pending Proxy Validation",
-            func=validate_pending_task,
-            interval=settings.validate_interval,
+        worker_tasks = [
+            (
+                "Pending Proxy Validation",
+                validate_pending_task,
+                settings.validate_interval,
+            ),
+        ]
+
+        candidates = shared_tasks + worker_tasks
+        acquired, all_stats = await redis_client.acquire_lock_with_task_stats(
+            "scheduler:task_initialization",
+            60,
+            [name for name, _, _ in candidates],
         )
 
+        # Workers that lost the lock skip the shared tasks
+        start = 0 if acquired else len(shared_tasks)
+        for name, func, interval in candidates[start:]:
+            self.add_task(name=name, func=func, interval=interval)
+        return all_stats[start:]
+
     async def initialize(self) -> None:
         """Initialize scheduler resources (database, Redis, tasks).
 
@@ -200,16 +257,14 @@ class Scheduler:
         # Initialize database connection
         await db.connect()
 
-        # Initialize tasks with distributed lock
-        await self._initialize_tasks()
+        # Initialize tasks with distributed lock and load their saved state
+        all_stats = await self._initialize_tasks()
 
         if not self.tasks:
             return
 
-        # Load task state from Redis
-        for task in self.tasks:
+        for task, stats in zip(self.tasks, all_stats):
             # Restore task statistics and schedule
-            stats = await redis_client.get_task_stats(task.name)
             if stats:
                 task.next_run = stats.get("next_run")
                 task.execution_count = stats["execution_count"]
@@ -239,53 +294,101 @@ class Scheduler:
         self.running = True
         logger.info(f"{c.GREEN}Scheduler started{c.END}")
 
-        # Create independent coroutine for each task to allow parallel execution
-        await asyncio.gather(*[self._run_task(task) for task in self.tasks])
+        self._loop = asyncio.get_running_loop()
+        now = datetime.now()
+
+        # Arm the first run from restored next_run times
+        for task in self.tasks:
+            delay = 0.0
+            if task.next_run:
+                delay = max(0.0, (task.next_run - now).total_seconds())
+                if delay > 0:
+                    self._log_next_run(task, delay)
+            self._arm(task, self._loop.time() + delay)
+
+    def _arm(self, task: Task, deadline: float) -> None:
+        """Schedule a task to fire at an absolute monotonic deadline.
+
+        Args:
+            task: Task instance to schedule
+            deadline: Event loop time at which the task should run
+        """
+        self._handles[task.name] = self._loop.call_at(
+            deadline, self._fire, task, deadline
+        )
+
+    def _fire(self, task: Task, deadline: float) -> None:
+        """Timer callback: spawn the due task and arm its next run.
+
+        Args:
+            task: Task instance that is due
+            deadline: Deadline this run was scheduled for
+        """
+        if not self.running:
+            return
+
+        # Advance by whole intervals so missed slots are skipped
+        # instead of being replayed back-to-back
+        now_mono = self._loop.time()
+        next_deadline = deadline + task.interval
+        if next_deadline <= now_mono:
+            missed = (now_mono - deadline) // task.interval
+            next_deadline = deadline + (missed + 1) * task.interval
 
-    async def _run_task(self, task: Task) -> None:
-        """Execute the task loop for a single scheduled task.
+        delay = next_deadline - now_mono
+        task.next_run = datetime.now() + timedelta(seconds=delay)
+        self._spawn(task)
+        self._arm(task, next_deadline)
+        self._log_next_run(task, delay)
 
-        Flow:
-        1. Check if next_run exists (from Redis or previous execution)
-        2. If next_run is in the future -> wait until that time
-        3. Execute the task (which sets the next next_run)
-        4. Repeat
+    def _spawn(self, task: Task) -> None:
+        """Run a task in the background, keeping a reference until it finishes.
 
         Args:
             task: Task instance to execute
         """
-        try:
-            while self.running:
-                # Calculate wait time if next_run is scheduled
-                if task.next_run:
-                    now = datetime.now()
-                    wait_seconds = (task.next_run - now).total_seconds()
-
-                    if wait_seconds > 0:
-                        next_time = task.next_run.strftime("%H:%M:%S")
-                        logger.info(
-                            f"{c.BLUE}[{task.name}]{c.END} Next execution at "
-                            f"{c.CYAN}{next_time}{c.END} "
-                            f"(in {c.YELLOW}{wait_seconds:.0f}s{c.END})"
-                        )
-
-                        await asyncio.sleep(wait_seconds)
-
-                # Execute the task (sets next_run for next iteration)
-                await task.run()
-
-        except asyncio.CancelledError:
-            logger.info(f"{c.BLUE}[{task.name}]{c.END} Task cancelled gracefully")
-            raise
-        except Exception as e:
-            logger.error(
-                f"{c.RED}[{task.name}]{c.END} Task loop crashed: {e}", exc_info=True
-            )
-            # Don't re-raise to prevent one task from crashing the entire scheduler
+        runner = self._loop.create_task(task.run())
+        self._inflight.add(runner)
+        runner.add_done_callback(self._inflight.discard)
+
+    def _log_next_run(self, task: Task, delay: float) -> None:
+        """Log when a task will execute next.
+
+        Args:
+            task: Task instance
+            delay: Seconds until the next execution
+        """
+        # Skip the strftime and formatting when INFO is filtered out
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        next_time = task.next_run.strftime("%H:%M:%S")
+        logger.info(
+            f"{c.BLUE}[{task.name}]{c.END} Next execution at "
+            f"{c.CYAN}{next_time}{c.END} "
+            f"(in {c.YELLOW}{delay:.0f}s{c.END})"
+        )
 
     async def stop(self) -> None:
+        """Stop scheduling and release resources.
+
+        Pending timers are cancelled and in-flight runs are cancelled and
+        awaited before the database and Redis connections are closed, so
+        shutdown does not wait for long tasks to finish on their own.
+        """
         self.running = False
 
+        for handle in self._handles.values():
+            handle.cancel()
+        self._handles.clear()
+
+        if self._inflight:
+            for runner in self._inflight:
+                runner.cancel()
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+        await validator_service.close()
+
         await db.close()
 
         await redis_client.close()
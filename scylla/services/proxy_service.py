@@ -8,11 +8,115 @@ validation tracking, quality scoring, and cleanup tasks.
 from datetime import datetime, timedelta
 from typing import AsyncGenerator, List, Optional, Tuple
 
+# Third-party imports
+import asyncpg
+
 # Local imports
-from scylla import logger
+from scylla import logger, PROXY_STATS_COLUMNS
+from scylla.core.config import settings
 from scylla.core.database import db
 from scylla.models.proxy import Proxy, ProxyStatus
 
+# Batches larger than this are bulk-loaded through COPY into a staging table
+COPY_THRESHOLD = 500
+
+# Projection of the /api/proxies item fields, with success_rate and url
+# computed in SQL, so API rows are serialized straight from asyncpg records
+API_COLUMNS = """
+    id, ip, port, protocol, country, anonymity, source, speed,
+    success_count, fail_count,
+    CASE WHEN success_count + fail_count > 0
+        THEN ROUND(success_count::numeric / (success_count + fail_count), 2)::float8
+        ELSE 0.0
+    END AS success_rate,
+    protocol || '://' || ip || ':' || port AS url,
+    last_checked, last_success, status
+"""
+
+# Columns the validator needs to test a proxy
+VALIDATION_COLUMNS = "id, ip, port, protocol, country"
+
+
+def _build_active_query(protocol: bool, country: bool, anonymity: bool) -> str:
+    """Build the active-proxy query for one combination of filters.
+
+    Args:
+        protocol: Whether the protocol filter is present
+        country: Whether the country filter is present
+        anonymity: Whether the anonymity filter is present
+
+    Returns:
+        SQL query with placeholders numbered in filter order, limit last
+    """
+    conditions = [f"status = {int(ProxyStatus.SUCCESS)}"]
+    param_index = 1
+
+    for column, enabled in (
+        ("protocol", protocol),
+        ("country", country),
+        ("anonymity", anonymity),
+    ):
+        if enabled:
+            conditions.append(f"{column} = ${param_index}")
+            param_index += 1
+
+    where_clause = " AND ".join(conditions)
+
+    return f"""
+        SELECT {API_COLUMNS}
+        FROM proxies
+        WHERE {where_clause}
+        ORDER BY
+            last_success DESC,
+            success_count DESC
+        LIMIT ${param_index}
+    """
+
+
+# Precompiled active-proxy queries keyed by which filters are present
+ACTIVE_PROXY_QUERIES = {
+    (p, c, a): _build_active_query(p, c, a)
+    for p in (False, True)
+    for c in (False, True)
+    for a in (False, True)
+}
+
+# Pool statistics are precomputed by the proxy_stats materialized view;
+# the snapshot is only used while it is younger than $1 seconds
+STATS_QUERY = """
+    SELECT total, active, inactive, checking, protocols, countries,
+        avg_speed, transparent, anonymous, elite
+    FROM proxy_stats
+    WHERE refreshed_at > NOW() - make_interval(secs => $1)
+"""
+
+# Live aggregation used when the snapshot is missing or stale
+LIVE_STATS_QUERY = f"SELECT {PROXY_STATS_COLUMNS} FROM proxies"
+
+# Batched validation write-back; a constant so asyncpg reuses one prepared
+# statement per connection instead of parsing the UPDATE for every batch
+VALIDATION_UPDATE_QUERY = f"""
+    UPDATE proxies
+    SET
+        success_count = CASE WHEN data.success THEN proxies.success_count + 1 ELSE 0 END,
+        fail_count = CASE WHEN data.success THEN GREATEST(proxies.fail_count - 1, 0) ELSE proxies.fail_count + 1 END,
+        last_checked = NOW(),
+        last_success = CASE WHEN data.success THEN NOW() ELSE proxies.last_success END,
+        speed = CASE WHEN data.success THEN data.speed ELSE proxies.speed END,
+        anonymity = CASE WHEN data.success THEN data.anonymity ELSE proxies.anonymity END,
+        status = CASE WHEN data.success
+            THEN {ProxyStatus.SUCCESS.value} ELSE {ProxyStatus.FAILED.value} END,
+        updated_at = NOW()
+    FROM (
+        SELECT
+            unnest($1::int[]) AS id,
+            unnest($2::bool[]) AS success,
+            unnest($3::float8[]) AS speed,
+            unnest($4::text[]) AS anonymity
+    ) AS data
+    WHERE proxies.id = data.id
+"""
+
 
 class ProxyService:
     """Service for managing proxy pool operations.
@@ -22,7 +126,7 @@ class ProxyService:
 
     Example:
         >>> from services.proxy_service import proxy_service
-        >>> proxies = await proxy_service.get_active_proxies(limit=10)
+        >>> proxies = await proxy_service.get_active_proxy_dicts(limit=10)
     """
 
     def _ensure_db(self):
@@ -39,29 +143,16 @@ class ProxyService:
     def _row_to_proxy(self, row) -> Proxy:
         """Convert database row to Proxy model.
 
+        Rows come from our own table and are already valid, so the model is
+        built with model_construct to skip per-field validation.
+
         Args:
             row: Database row record
 
         Returns:
             Proxy instance populated from row data
         """
-        return Proxy(
-            id=row["id"],
-            ip=row["ip"],
-            port=row["port"],
-            protocol=row["protocol"],
-            country=row["country"],
-            anonymity=row["anonymity"],
-            source=row["source"],
-            speed=row["speed"],
-            success_count=row.get("success_count", 0),
-            fail_count=row.get("fail_count", 0),
-            status=row.get("status", 0),
-            last_checked=row.get("last_checked"),
-            last_success=row.get("last_success"),
-            created_at=row.get("created_at"),
-            updated_at=row.get("updated_at"),
-        )
+        return Proxy.model_construct(**row)
 
     async def add_proxy(self, proxy: Proxy) -> Optional[int]:
         """Add a single proxy to the database.
@@ -98,25 +189,23 @@ class ProxyService:
     async def add_batch(self, proxies: List[Proxy]) -> int:
         """Add multiple proxies to database using batch operation.
 
-        Uses executemany for better performance compared to individual inserts.
+        Small batches are inserted in one statement from unnested arrays.
+        Batches above COPY_THRESHOLD are streamed with COPY into a temporary
+        staging table and merged in a single INSERT ... SELECT. Both paths
+        count rows from the command status, so duplicates skipped by
+        ON CONFLICT are not reported as added.
 
         Args:
             proxies: List of Proxy instances to add
 
         Returns:
-            Number of successfully added proxies
+            Number of newly inserted proxies
         """
         self._ensure_db()
 
         if not proxies:
             return 0
 
-        query = """
-        INSERT INTO proxies (ip, port, protocol, country, source, status)
-        VALUES ($1, $2, $3, $4, $5, $6)
-        ON CONFLICT (ip, port, protocol) DO NOTHING;
-        """
-
         try:
             # Prepare batch data
             batch_data = [
@@ -124,57 +213,105 @@ class ProxyService:
                 for p in proxies
             ]
 
-            async with db.pool.acquire() as conn:
-                await conn.executemany(query, batch_data)
+            if len(batch_data) > COPY_THRESHOLD:
+                return await self._copy_batch(batch_data)
+
+            ips, ports, protocols, countries, sources, statuses = zip(*batch_data)
+            query = """
+            INSERT INTO proxies (ip, port, protocol, country, source, status)
+            SELECT * FROM unnest(
+                $1::varchar[], $2::int[], $3::varchar[],
+                $4::varchar[], $5::varchar[], $6::smallint[]
+            )
+            ON CONFLICT (ip, port, protocol) DO NOTHING
+            """
+            result = await db.execute(
+                query,
+                list(ips),
+                list(ports),
+                list(protocols),
+                list(countries),
+                list(sources),
+                list(statuses),
+            )
 
-            return len(proxies)
+            return int(result.split()[-1])
 
         except Exception as e:
             logger.error(f"Batch insert failed: {e}", exc_info=True)
             return 0
 
-    async def record_validation_result(
-        self,
-        proxy_id: int,
-        is_success: bool,
-        response_time: Optional[float] = None,
-        anonymity: Optional[str] = None,
-    ) -> None:
-        """Record proxy validation result with single optimized query.
+    async def _copy_batch(self, batch_data: List[tuple]) -> int:
+        """Bulk load proxy rows via COPY into a staging table.
 
         Args:
-            proxy_id: ID of proxy to update
-            is_success: Whether validation was successful
-            response_time: Response time in seconds (if successful)
-            anonymity: Anonymity level (transparent/anonymous/elite, if successful)
+            batch_data: List of (ip, port, protocol, country, source, status) tuples
+
+        Returns:
+            Number of newly inserted proxies
         """
-        self._ensure_db()
+        async with db.pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    """
+                    CREATE TEMP TABLE proxies_staging (
+                        ip VARCHAR(45),
+                        port INTEGER,
+                        protocol VARCHAR(10),
+                        country VARCHAR(2),
+                        source VARCHAR(100),
+                        status SMALLINT
+                    ) ON COMMIT DROP
+                    """
+                )
+                await conn.copy_records_to_table("proxies_staging", records=batch_data)
+                result = await conn.execute(
+                    """
+                    INSERT INTO proxies (ip, port, protocol, country, source, status)
+                    SELECT ip, port, protocol, country, source, status
+                    FROM proxies_staging
+                    ON CONFLICT (ip, port, protocol) DO NOTHING
+                    """
+                )
 
-        if response_time is not None:
-            response_time = round(response_time, 2)
+        return int(result.split()[-1])
 
-        target_status = int(ProxyStatus.SUCCESS if is_success else ProxyStatus.FAILED)
-        query = """
-            UPDATE proxies 
-            SET 
-                success_count = CASE WHEN $2 THEN success_count + 1 ELSE 0 END,
-                fail_count = CASE WHEN $2 THEN GREATEST(fail_count - 1, 0) ELSE fail_count + 1 END,
-                last_checked = NOW(),
-                last_success = CASE WHEN $2 THEN NOW() ELSE last_success END,
-                speed = CASE WHEN $2 THEN $3 ELSE speed END,
-                anonymity = CASE WHEN $2 THEN $5 ELSE anonymity END,
-                status = $4,
-                updated_at = NOW()
-            WHERE id = $1
+    async def record_validation_results(
+        self, results: List[Tuple[int, bool, Optional[float], Optional[str]]]
+    ) -> int:
+        """Record a batch of validation results with a single UPDATE.
+
+        A success bumps success_count and decays fail_count, a failure
+        resets success_count and bumps fail_count; the proxies table is
+        joined against unnested result arrays.
+
+        Args:
+            results: List of (proxy_id, is_success, response_time, anonymity) tuples
+
+        Returns:
+            Number of updated records
         """
-        await db.execute(
-            query,
-            proxy_id,
-            is_success,
-            response_time,
-            target_status,
-            anonymity,
+        if not results:
+            return 0
+
+        self._ensure_db()
+
+        ids = []
+        successes = []
+        speeds = []
+        anonymities = []
+        for proxy_id, is_success, response_time, anonymity in results:
+            ids.append(proxy_id)
+            successes.append(is_success)
+            speeds.append(
+                round(response_time, 2) if response_time is not None else None
+            )
+            anonymities.append(anonymity)
+
+        result = await db.execute(
+            VALIDATION_UPDATE_QUERY, ids, successes, speeds, anonymities
         )
+        return int(result.split()[-1]) if result else 0
 
     async def record_failure(self, proxy_id: int):
         """Record a validation failure for a proxy.
@@ -193,14 +330,18 @@ class ProxyService:
         """
         await db.execute(query, datetime.now(), proxy_id)
 
-    async def get_active_proxies(
+    def _active_query(
         self,
-        protocol: Optional[str] = None,
-        country: Optional[str] = None,
-        anonymity: Optional[str] = None,
-        limit: int = 10,
-    ) -> AsyncGenerator[Proxy, None]:
-        """Get active proxies with optional filtering.
+        protocol: Optional[str],
+        country: Optional[str],
+        anonymity: Optional[str],
+        limit: int,
+    ) -> Tuple[str, list]:
+        """Pick the precompiled active-proxy query and its parameters.
+
+        Filter values are expected already normalized (lowercase protocol
+        and anonymity, uppercase country), as /api/proxies does when it
+        validates them.
 
         Args:
             protocol: Filter by protocol (http/https/socks4/socks5)
@@ -208,46 +349,41 @@ class ProxyService:
             anonymity: Filter by anonymity level (transparent/anonymous/elite)
             limit: Maximum number of proxies to return
 
-        Yields:
-            Proxy instances matching the criteria
+        Returns:
+            Tuple of (query, params)
         """
-        self._ensure_db()
-
-        conditions = [f"status = {int(ProxyStatus.SUCCESS)}"]
-        params = []
-        param_index = 1
+        params = [value for value in (protocol, country, anonymity) if value]
+        params.append(limit)
 
-        if protocol:
-            conditions.append(f"protocol = ${param_index}")
-            params.append(protocol.lower())
-            param_index += 1
+        query = ACTIVE_PROXY_QUERIES[(bool(protocol), bool(country), bool(anonymity))]
+        return query, params
 
-        if country:
-            conditions.append(f"country = ${param_index}")
-            params.append(country.upper())
-            param_index += 1
+    async def get_active_proxy_dicts(
+        self,
+        protocol: Optional[str] = None,
+        country: Optional[str] = None,
+        anonymity: Optional[str] = None,
+        limit: int = 10,
+    ) -> List[dict]:
+        """Get active proxies as API dictionaries, skipping the Proxy model.
 
-        if anonymity:
-            conditions.append(f"anonymity = ${param_index}")
-            params.append(anonymity.lower())
-            param_index += 1
+        The query already projects the API fields (API_COLUMNS), so each
+        record is converted with dict() in asyncpg's C code.
 
-        where_clause = " AND ".join(conditions)
+        Args:
+            protocol: Filter by protocol (http/https/socks4/socks5)
+            country: Filter by country code (ISO 3166-1 alpha-2)
+            anonymity: Filter by anonymity level (transparent/anonymous/elite)
+            limit: Maximum number of proxies to return
 
-        query = f"""
-            SELECT *
-            FROM proxies
-            WHERE {where_clause}
-            ORDER BY 
-                last_success DESC,
-                success_count DESC
-            LIMIT ${param_index}
+        Returns:
+            List of proxy dictionaries keyed by the API_COLUMNS names
         """
-        params.append(limit)
+        self._ensure_db()
 
-        rows = await db.fetch(query, *params)
-        for row in rows:
-            yield self._row_to_proxy(row)
+        query, params = self._active_query(protocol, country, anonymity, limit)
+        rows = await db.fetch_read(query, *params)
+        return [dict(row) for row in rows]
 
     async def get_proxies_needing_validation(
         self, limit: int = 500, max_fail_count: int = 3
@@ -266,7 +402,7 @@ class ProxyService:
         self._ensure_db()
 
         query = f"""
-            SELECT *
+            SELECT {VALIDATION_COLUMNS}
             FROM proxies
             WHERE fail_count < {max_fail_count}
                 AND status IN ({ProxyStatus.PENDING.value}, {ProxyStatus.FAILED.value})
@@ -295,7 +431,7 @@ class ProxyService:
         self._ensure_db()
 
         query = f"""
-            SELECT *
+            SELECT {VALIDATION_COLUMNS}
             FROM proxies
             WHERE status = {ProxyStatus.SUCCESS.value}
             ORDER BY last_checked ASC NULLS FIRST
@@ -336,9 +472,14 @@ class ProxyService:
         self._ensure_db()
 
         cutoff_date = datetime.now() - timedelta(days=days)
+        # Each branch is served by its own index instead of an OR seq scan
         query = """
             DELETE FROM proxies
-            WHERE last_success < $1 OR (last_success IS NULL AND created_at < $1)
+            WHERE id IN (
+                SELECT id FROM proxies WHERE last_success < $1
+                UNION ALL
+                SELECT id FROM proxies WHERE last_success IS NULL AND created_at < $1
+            )
         """
         result = await db.execute(query, cutoff_date)
         return int(result.split()[-1])
@@ -347,7 +488,9 @@ class ProxyService:
         """Get all proxies for backup operations using batch processing.
 
         Retrieves proxy records in batches to avoid memory issues with large datasets.
-        Uses cursor-based pagination for efficient streaming.
+        Streams rows through a server-side cursor inside a read-only
+        REPEATABLE READ transaction, so the export is one consistent snapshot
+        and only one batch is held in memory at a time.
 
         Args:
             batch_size: Number of records to fetch per batch (default: 1000)
@@ -357,49 +500,48 @@ class ProxyService:
         """
         self._ensure_db()
 
-        offset = 0
-        while True:
-            query = f"""
-                SELECT * FROM proxies 
-                ORDER BY id 
-                LIMIT $1 OFFSET $2
-            """
-            rows = await db.fetch(query, batch_size, offset)
+        async with db.pool.acquire() as conn:
+            async with conn.transaction(isolation="repeatable_read", readonly=True):
+                cursor = await conn.cursor("SELECT * FROM proxies ORDER BY id")
+                while True:
+                    rows = await cursor.fetch(batch_size)
+
+                    if not rows:
+                        break
 
-            if not rows:
-                break
+                    yield rows
 
-            yield rows
+                    # If we got fewer rows than batch_size, we've reached the end
+                    if len(rows) < batch_size:
+                        break
 
-            # If we got fewer rows than batch_size, we've reached the end
-            if len(rows) < batch_size:
-                break
+    async def refresh_stats(self) -> None:
+        """Recompute the proxy_stats materialized view.
 
-            offset += batch_size
+        CONCURRENTLY lets get_stats keep reading the previous snapshot while
+        the aggregation runs.
+        """
+        self._ensure_db()
+        await db.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY proxy_stats")
 
     async def get_stats(self) -> dict:
         """Get proxy statistics.
 
+        Reads the proxy_stats snapshot instead of aggregating the table.
+        Only the worker holding the shared tasks refreshes it, so if the
+        snapshot is older than two refresh intervals (e.g. no worker took
+        the tasks after a restart), the table is aggregated live instead.
+
         Returns:
             Dictionary with proxy counts and statistics including anonymity breakdown
         """
         self._ensure_db()
 
-        query = f"""
-            SELECT 
-                COUNT(*) as total,
-                COUNT(*) FILTER (WHERE status = {ProxyStatus.SUCCESS.value}) as active,
-                COUNT(*) FILTER (WHERE status = {ProxyStatus.FAILED.value}) as inactive,
-                COUNT(*) FILTER (WHERE status = {ProxyStatus.PENDING.value}) as checking,
-                COUNT(DISTINCT protocol) as protocols,
-                COUNT(DISTINCT country) as countries,
-                AVG(speed) FILTER (WHERE speed IS NOT NULL) as avg_speed,
-                COUNT(*) FILTER (WHERE anonymity = 'transparent') as transparent,
-                COUNT(*) FILTER (WHERE anonymity = 'anonymous') as anonymous,
-                COUNT(*) FILTER (WHERE anonymity = 'elite') as elite
-            FROM proxies
-        """
-        row = await db.fetchrow(query)
+        row = await db.fetchrow_read(
+            STATS_QUERY, float(settings.stats_refresh_interval * 2)
+        )
+        if row is None:
+            row = await db.fetchrow_read(LIVE_STATS_QUERY)
 
         return {
             "total": row["total"],
@@ -418,7 +560,9 @@ class ProxyService:
             },
         }
 
-    async def get_proxies_without_country(self, limit: int = 100) -> List[dict]:
+    async def get_proxies_without_country(
+        self, limit: int = 100
+    ) -> List[asyncpg.Record]:
         """Get successful proxies that don't have country information.
 
         Only returns proxies with SUCCESS status to avoid updating country
@@ -428,7 +572,8 @@ class ProxyService:
             limit: Maximum number of proxies to return (default: 100)
 
         Returns:
-            List of dictionaries with 'id' and 'ip' keys
+            List of asyncpg records with 'id' and 'ip' fields, read with
+            row["id"] / row["ip"] like dictionaries
         """
         self._ensure_db()
 
@@ -438,8 +583,7 @@ class ProxyService:
                 AND status = {int(ProxyStatus.SUCCESS)}
             LIMIT $1
         """
-        rows = await db.fetch(query, limit)
-        return [{"id": row["id"], "ip": row["ip"]} for row in rows]
+        return await db.fetch(query, limit)
 
     async def update_proxy_country(self, proxy_id: int, country_code: str) -> None:
         """Update the country code for a specific proxy.
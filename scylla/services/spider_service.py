@@ -12,6 +12,9 @@ from scylla.core.config import settings
 from scylla.models import Proxy
 from scylla.spiders.base import BaseSpider
 
+# Directory scanned for spider modules, resolved once at import
+SPIDERS_DIR = Path(__file__).resolve().parent.parent / "spiders"
+
 
 class SpiderService:
     """Service for managing and executing proxy spiders"""
@@ -29,43 +32,35 @@ class SpiderService:
     def _load_spiders(self) -> List[BaseSpider]:
         """Dynamically load all spider classes from the spiders directory"""
         spiders = []
-        spiders_dir = Path(__file__).parent.parent / "spiders"
 
-        if not spiders_dir.exists():
-            logger.warning(f"Spiders directory not found: {spiders_dir}")
+        if not SPIDERS_DIR.exists():
+            logger.warning(f"Spiders directory not found: {SPIDERS_DIR}")
             return spiders
 
-        for path in spiders_dir.glob("*.py"):
+        # Importing a module registers its spiders via __init_subclass__
+        for path in SPIDERS_DIR.glob("*.py"):
             if path.name.startswith("_"):
                 continue
 
             module_name = f"scylla.spiders.{path.stem}"
 
             try:
-                # Dynamically import module
-                module = import_module(module_name)
-
-                # Find all BaseSpider subclasses defined in this module
-                for name, spider_class in inspect.getmembers(module, inspect.isclass):
-                    # Only load spiders defined in this module (not imported ones)
-                    if (
-                        issubclass(spider_class, BaseSpider)
-                        and spider_class is not BaseSpider
-                        and spider_class.__module__ == module_name
-                    ):
-                        try:
-                            spider_instance = spider_class()
-                            if spider_instance.status:
-                                spiders.append(spider_instance)
-                                logger.debug(f"Loaded spider: {spider_instance.name}")
-                        except Exception as e:
-                            logger.error(
-                                f"Failed to instantiate spider {spider_class.__name__}: {e}"
-                            )
-
+                import_module(module_name)
             except Exception as e:
                 logger.error(f"Failed to load module {module_name}: {e}")
+
+        for spider_class in BaseSpider.registry:
+            if inspect.isabstract(spider_class):
                 continue
+            try:
+                spider_instance = spider_class()
+                if spider_instance.status:
+                    spiders.append(spider_instance)
+                    logger.debug(f"Loaded spider: {spider_instance.name}")
+            except Exception as e:
+                logger.error(
+                    f"Failed to instantiate spider {spider_class.__name__}: {e}"
+                )
 
         logger.debug(f"Successfully loaded {len(spiders)} active spider(s)")
         return spiders
@@ -117,11 +112,12 @@ class SpiderService:
                 )
             return None
 
-    async def run_all(self) -> List[Optional[List[Proxy]]]:
+    async def run_all(self) -> List[List[Proxy]]:
         """Run all enabled spiders concurrently with semaphore control
 
         Returns:
-            List of results from all spiders (each result is a list of proxies or None)
+            Proxy lists from spiders that fetched results; failed or empty
+            spiders are logged and omitted
         """
         if not self.spiders:
             logger.warning(f"{c.YELLOW}No active spiders found{c.END}")
@@ -135,11 +131,22 @@ class SpiderService:
 
         semaphore = asyncio.Semaphore(settings.max_concurrent_spiders)
 
-        return await asyncio.gather(
+        outcomes = await asyncio.gather(
             *[self._run_with_semaphore(semaphore, spider) for spider in self.spiders],
             return_exceptions=True,
         )
 
+        results = []
+        for spider, outcome in zip(self.spiders, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(
+                    f"{c.RED}[{spider.name}] ✗ Failed{c.END} - "
+                    f"{type(outcome).__name__}: {outcome}"
+                )
+            elif outcome:
+                results.append(outcome)
+        return results
+
     async def run_spider(self, spider_name: str) -> Optional[List[Proxy]]:
         """Run a specific spider by name
 
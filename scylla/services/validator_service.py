@@ -30,50 +30,78 @@ class ValidatorService:
     common proxy protocols. Implements semaphore-based concurrency control
     for efficient batch validation.
 
-    Each batch validation creates its own session to avoid multi-worker conflicts.
+    Each worker process lazily creates one session on first use and reuses it
+    for every batch, so TLS contexts and curl handles are not rebuilt per
+    batch. The proxy is passed per request, so batches do not interfere.
     """
 
     # Suspicious headers that may reveal proxy usage
-    SUSPICIOUS_HEADERS = [
-        "x-forwarded-for",
-        "x-real-ip",
-        "via",
-        "x-proxy-id",
-        "proxy-connection",
-        "forwarded",
-        "client-ip",
-        "x-client-ip",
-    ]
+    SUSPICIOUS_HEADERS = frozenset(
+        (
+            "x-forwarded-for",
+            "x-real-ip",
+            "via",
+            "x-proxy-id",
+            "proxy-connection",
+            "forwarded",
+            "client-ip",
+            "x-client-ip",
+        )
+    )
 
     def __init__(self):
         """Initialize validator with configuration from settings."""
         self.test_urls = settings.validator_test_urls
         self.timeout = settings.validator_timeout
         self.max_concurrent = settings.max_concurrent_validators
+        self._session: Optional[AsyncSession] = None
+
+    def _get_session(self) -> AsyncSession:
+        """Get the shared session, creating it on first use.
+
+        Returns:
+            AsyncSession reused across validation batches
+        """
+        if self._session is None:
+            # Allow as many curl handles as a batch may run concurrently;
+            # discard cookies so none set through one proxy reach another
+            self._session = AsyncSession(
+                max_clients=self.max_concurrent, discard_cookies=True
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared session if it was created."""
+        if self._session is not None:
+            try:
+                await self._session.close()
+            except Exception as e:
+                logger.debug(f"Error closing validator session: {e}")
+            finally:
+                self._session = None
 
     def _detect_anonymity(self, headers: dict, proxy_ip: str) -> str:
         """Detect proxy anonymity level from response headers.
 
         Args:
-            headers: Response headers dictionary
+            headers: Response headers mapping
             proxy_ip: The proxy's IP address
 
         Returns:
             Anonymity level: 'transparent', 'anonymous', or 'elite'
         """
-        headers_lower = {k.lower(): v for k, v in headers.items()}
+        suspicious = self.SUSPICIOUS_HEADERS
+        anonymity = "elite"
 
-        # Check if proxy IP is exposed in any header value
-        for header_value in headers.values():
-            if proxy_ip in str(header_value):
+        # Single pass: an exposed proxy IP wins immediately, a non-empty
+        # proxy-revealing header downgrades elite to anonymous
+        for name, value in headers.items():
+            if proxy_ip in str(value):
                 return "transparent"
+            if value and name.lower() in suspicious:
+                anonymity = "anonymous"
 
-        # Check for proxy-revealing headers
-        for header_name in self.SUSPICIOUS_HEADERS:
-            if headers_lower.get(header_name):
-                return "anonymous"
-
-        return "elite"
+        return anonymity
 
     async def _validate_single(
         self,
@@ -120,9 +148,7 @@ class ValidatorService:
 
             if response.ok:
                 response_time = time.time() - start_time
-                headers = dict(response.headers)
-
-                anonymity = self._detect_anonymity(headers, proxy.ip)
+                anonymity = self._detect_anonymity(response.headers, proxy.ip)
                 success = True
 
                 logger.info(
@@ -144,7 +170,7 @@ class ValidatorService:
     async def validate_batch(self, proxies: List[Proxy]) -> Dict[str, Any]:
         """Batch validate proxies with concurrent execution.
 
-        Creates a dedicated session for this batch to avoid multi-worker conflicts.
+        Reuses the service's shared session across batches.
         Uses semaphore to control concurrency and prevent resource exhaustion.
         Returns validation results without performing database updates.
 
@@ -167,13 +193,12 @@ class ValidatorService:
             async with semaphore:
                 return await self._validate_single(session, proxy)
 
-        # Use dedicated session for this batch
-        async with AsyncSession() as session:
-            tasks = [
-                asyncio.create_task(validate_with_semaphore(session, proxy))
-                for proxy in proxies
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        session = self._get_session()
+        tasks = [
+            asyncio.create_task(validate_with_semaphore(session, proxy))
+            for proxy in proxies
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Process results
         success_count = 0
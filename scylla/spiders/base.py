@@ -7,6 +7,9 @@ from aiohttp import ClientSession, ClientResponse
 from bs4 import BeautifulSoup
 import asyncio
 
+# Yield to the event loop once every this many parsed items (must be 2**n)
+YIELD_EVERY = 1024
+
 
 class BaseSpider(ABC):
     """Base class for all proxy spiders
@@ -19,6 +22,13 @@ class BaseSpider(ABC):
     status: bool = True
     name: Optional[str] = None
 
+    # Spider subclasses, registered as their modules are imported
+    registry: List[type] = []
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        BaseSpider.registry.append(cls)
+
     def __init__(
         self,
         request_session: Optional[ClientSession] = None,
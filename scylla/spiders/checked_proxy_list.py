@@ -1,7 +1,8 @@
-from scylla.spiders.base import BaseSpider
+from scylla.spiders.base import BaseSpider, YIELD_EVERY
 from scylla.models import Proxy
 from typing import List
-import json
+import asyncio
+import orjson
 
 
 class CheckedProxyListSpider(BaseSpider):
@@ -17,9 +18,13 @@ class CheckedProxyListSpider(BaseSpider):
 
         for url in self.url_list:
             response = await self.request(url)
-            html = await response.text()
-            items = json.loads(html)
-            for proxy in items:
+            # orjson parses the raw body, skipping the str decode step
+            items = orjson.loads(await response.read())
+            for i, proxy in enumerate(items):
+                # Large lists are parsed in one go; let API handlers run
+                if not i & (YIELD_EVERY - 1):
+                    await asyncio.sleep(0)
+
                 ip = proxy.get("ip")
                 port = proxy.get("port")
                 protocol = proxy.get("protocol")
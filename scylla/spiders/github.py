@@ -1,6 +1,7 @@
-from scylla.spiders.base import BaseSpider
+from scylla.spiders.base import BaseSpider, YIELD_EVERY
 from scylla.models import Proxy
 from typing import List
+import asyncio
 
 
 class GithubSpider(BaseSpider):
@@ -44,7 +45,11 @@ class GithubSpider(BaseSpider):
                 response = await self.request(url)
                 html = await response.text()
                 items = html.split("\n")
-                for item in items:
+                for i, item in enumerate(items):
+                    # Large lists are parsed in one go; let API handlers run
+                    if not i & (YIELD_EVERY - 1):
+                        await asyncio.sleep(0)
+
                     if ":" not in item:
                         continue
 
@@ -8,6 +8,7 @@ from scylla.tasks.validate_pending_task import validate_pending_task
 from scylla.tasks.validate_success_task import validate_success_task
 from scylla.tasks.cleanup_task import cleanup_task
 from scylla.tasks.update_country_task import update_country_task
+from scylla.tasks.stats_refresh_task import stats_refresh_task
 
 __all__ = [
     "crawl_task",
@@ -15,4 +16,5 @@ __all__ = [
     "validate_success_task",
     "cleanup_task",
     "update_country_task",
+    "stats_refresh_task",
 ]
@@ -8,6 +8,7 @@ from datetime import datetime
 
 # Local imports
 from scylla import logger, c
+from scylla.core.config import settings
 from scylla.services.proxy_service import proxy_service
 
 
@@ -20,8 +21,10 @@ async def cleanup_task():
     try:
         start_time = datetime.now()
 
-        # Clean up failed proxies (fail_count >= 3)
-        failed_deleted = await proxy_service.cleanup_failed_proxies(max_failures=3)
+        # Clean up failed proxies (fail_count >= max_fail_count)
+        failed_deleted = await proxy_service.cleanup_failed_proxies(
+            max_failures=settings.max_fail_count
+        )
 
         # Clean up stale proxies (no success in 7 days)
         stale_deleted = await proxy_service.cleanup_stale_proxies(days=7)
@@ -11,6 +11,18 @@ from scylla import logger, c
 from scylla.services.spider_service import spider_service
 from scylla.services.proxy_service import proxy_service
 
+# Summary log line with color codes resolved once at import
+CRAWL_DONE_TEMPLATE = (
+    f"{c.GREEN}Proxy crawl completed{c.END} - "
+    f"fetched {c.CYAN}%d{c.END} proxies, "
+    f"saved {c.PURPLE}%d{c.END}, "
+    f"failed {c.RED}%d{c.END}, "
+    f"time: {c.BLUE}%.2fs{c.END}"
+)
+
+# Per-spider debug line, formatted by logging only when DEBUG is enabled
+SPIDER_SAVED_TEMPLATE = f"[%s] saved {c.PURPLE}%d{c.END} of {c.CYAN}%d{c.END} proxies"
+
 
 async def crawl_task():
     """Execute proxy crawling from all configured spider sources.
@@ -24,26 +36,26 @@ async def crawl_task():
 
         results = await spider_service.run_all()
 
-        # Process and save proxies
+        # Save each spider's proxies in its own batch, so a failed insert
+        # only loses that spider's results
         total_proxies = 0
         saved_proxies = 0
         failed_proxies = 0
 
         for proxies in results:
-            if not isinstance(proxies, list):
-                continue
-
+            saved = await proxy_service.add_batch(proxies)
             total_proxies += len(proxies)
-            saved_proxies += await proxy_service.add_batch(proxies)
+            saved_proxies += saved
+            logger.debug(SPIDER_SAVED_TEMPLATE, proxies[0].source, saved, len(proxies))
 
         execution_time = (datetime.now() - start_time).total_seconds()
 
         logger.info(
-            f"{c.GREEN}Proxy crawl completed{c.END} - "
-            f"fetched {c.CYAN}{total_proxies}{c.END} proxies, "
-            f"saved {c.PURPLE}{saved_proxies}{c.END}, "
-            f"failed {c.RED}{failed_proxies}{c.END}, "
-            f"time: {c.BLUE}{execution_time:.2f}s{c.END}"
+            CRAWL_DONE_TEMPLATE,
+            total_proxies,
+            saved_proxies,
+            failed_proxies,
+            execution_time,
         )
     except Exception as e:
         logger.error(f"Proxy crawl task failed: {e}", exc_info=True)
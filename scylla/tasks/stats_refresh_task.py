@@ -0,0 +1,32 @@
+"""Stats refresh task module
+
+Periodically recomputes the proxy statistics snapshot served by the API.
+"""
+
+# Standard library imports
+from datetime import datetime
+
+# Local imports
+from scylla import logger, c
+from scylla.services.proxy_service import proxy_service
+
+
+async def stats_refresh_task():
+    """Refresh the proxy_stats materialized view.
+
+    /api/stats and /api/metrics read this snapshot, so the table is scanned
+    once per interval across all workers rather than once per request.
+    """
+    try:
+        start_time = datetime.now()
+
+        await proxy_service.refresh_stats()
+
+        execution_time = (datetime.now() - start_time).total_seconds()
+        logger.debug(
+            f"{c.GREEN}Stats refreshed{c.END} - "
+            f"time: {c.BLUE}{execution_time:.2f}s{c.END}"
+        )
+
+    except Exception as e:
+        logger.error(f"Stats refresh task failed: {e}", exc_info=True)
@@ -41,16 +41,14 @@ async def execute_validation(
         # Batch validate proxies with concurrent execution
         stats = await validator_service.validate_batch(proxies)
 
-        # Update database for each validation result
-        for proxy_id, is_success, response_time, anonymity in stats["results"]:
-            if proxy_id == 0:
-                continue
-            try:
-                await proxy_service.record_validation_result(
-                    proxy_id, is_success, response_time, anonymity
-                )
-            except Exception as e:
-                logger.error(f"Failed to update database for proxy {proxy_id}: {e}")
+        # Write back all validation results in a single batched update
+        results = [r for r in stats["results"] if r[0] != 0]
+        try:
+            await proxy_service.record_validation_results(results)
+        except Exception as e:
+            logger.error(
+                f"Failed to update database for {len(results)} validated proxies: {e}"
+            )
 
         execution_time = (datetime.now() - start_time).total_seconds()
         logger.info(